@@ -1,15 +1,14 @@
 import asyncio
 
-from gemini_flow import Gemini
+from gemini_flow import Gemini, abatch_stream
 
 
 async def main() -> None:
-    ai = Gemini(model="gemini-3-pro-2")
-
-    # stream = await ai.astream_chat("描述照片中的內容。", images=["./input/大為.png"])
-    stream = await ai.astream_chat("講一個故事")
-    async for chunk in stream:
-        print(chunk, end="", flush=True)
+    async with Gemini(model="gemini-3-pro") as ai:
+        # stream = await ai.astream_chat("描述照片中的內容。", images=["./input/大為.png"])
+        stream = await ai.astream_chat("講一個故事")
+        async for batch in abatch_stream(stream):
+            print(batch, end="", flush=True)
 
 
 if __name__ == "__main__":
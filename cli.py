@@ -11,6 +11,7 @@ from typing import Optional
 #   python cli.py chat -c ../../user_cookies "hello"
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
+from gemini_flow import abatch_stream  # noqa: E402
 from gemini_flow.gemini.client import GeminiWebClient  # noqa: E402
 from gemini_flow.gemini.protocol import MODEL_HEADERS  # noqa: E402
 
@@ -48,20 +49,20 @@ async def _run_chat(
     debug: bool,
 ) -> int:
     try:
-        client = GeminiWebClient()
-        stream = await client.chat(
-            prompt=prompt,
-            model=model,
-            language=lang,
-            cookies_dir=cookies_dir,
-            images=images,
-            proxy=proxy,
-            debug=debug,
-        )
-        had_output = False
-        async for chunk in stream:
-            had_output = True
-            print(chunk, end="", flush=True)
+        async with GeminiWebClient() as client:
+            stream = await client.chat(
+                prompt=prompt,
+                model=model,
+                language=lang,
+                cookies_dir=cookies_dir,
+                images=images,
+                proxy=proxy,
+                debug=debug,
+            )
+            had_output = False
+            async for batch in abatch_stream(stream):
+                had_output = True
+                print(batch, end="", flush=True)
         print()
         if debug and not had_output:
             print("[debug] No text chunks were parsed from the response.")
@@ -1,7 +1,8 @@
 __all__ = [
     "Gemini",
     "GeminiWebClient",
+    "abatch_stream",
 ]
 
-from .entrypoint import Gemini
+from .entrypoint import Gemini, abatch_stream
 from .gemini.client import GeminiWebClient
@@ -1,16 +1,47 @@
 from __future__ import annotations
 
 import asyncio
+import io
+import time
 from pathlib import Path
-from typing import Callable, Optional, Sequence, Tuple, Union
+from typing import AsyncIterator, Callable, Optional, Sequence, Tuple, Union
 
 from .gemini.client import GeminiWebClient
+from .types import AsyncTextStream
 
 
 PathLike = Union[str, Path]
 ImageInput = Union[PathLike, Tuple[bytes, str]]
 
 
+async def abatch_stream(
+    stream: AsyncTextStream,
+    *,
+    flush_interval: float = 0.015,
+    max_buffer: int = 512,
+) -> AsyncIterator[str]:
+    """Coalesce streamed chunks into fewer, larger strings.
+
+    Per-chunk printing/callback overhead (stdout flush, SSE write, ...) adds up
+    over thousands of tiny deltas; a short soft-flush window keeps streaming
+    smooth while cutting the number of downstream writes.
+    """
+    buf: list[str] = []
+    size = 0
+    last_flush = time.monotonic()
+    async for chunk in stream:
+        buf.append(chunk)
+        size += len(chunk)
+        now = time.monotonic()
+        if size >= max_buffer or now - last_flush >= flush_interval:
+            yield "".join(buf)
+            buf.clear()
+            size = 0
+            last_flush = now
+    if buf:
+        yield "".join(buf)
+
+
 class Gemini:
     def __init__(
         self,
@@ -31,6 +62,16 @@ class Gemini:
         self.auto_refresh_cookies = auto_refresh_cookies
         self._client = client or GeminiWebClient()
 
+    async def aclose(self) -> None:
+        """Close the underlying client and its pooled HTTP session."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "Gemini":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
     async def astream_chat(
         self,
         prompt: str,
@@ -47,10 +88,15 @@ class Gemini:
             image_inputs = []
             for item in images:
                 if isinstance(item, tuple) and len(item) == 2 and isinstance(item[0], (bytes, bytearray)):
-                    image_inputs.append((bytes(item[0]), str(item[1])))
+                    # Only copy when mutable; `bytes(...)` on an already-immutable
+                    # payload would duplicate the whole image buffer.
+                    data = item[0] if type(item[0]) is bytes else bytes(item[0])
+                    image_inputs.append((data, str(item[1])))
+                elif isinstance(item, Path):
+                    image_inputs.append(item)
                 else:
                     image_inputs.append(Path(item))
-        return await self._client.chat(
+        stream = await self._client.chat(
             prompt=prompt,
             model=model or self.model,
             language=language or self.language,
@@ -62,6 +108,15 @@ class Gemini:
             save_images=True if save_images is None else save_images,
         )
 
+        async def _yielding():
+            # Zero-delay yield so concurrent tasks get a turn even when the
+            # consumer loop interleaves CPU-bound parsing with printing.
+            async for chunk in stream:
+                yield chunk
+                await asyncio.sleep(0)
+
+        return _yielding()
+
     async def achat(
         self,
         prompt: str,
@@ -82,10 +137,12 @@ class Gemini:
             debug=debug,
             save_images=save_images,
         )
-        parts: list[str] = []
+        # StringIO's C-backed write is cheaper per chunk than list.append and
+        # avoids holding the chunk list and the joined string at the same time.
+        buf = io.StringIO()
         async for chunk in stream:
-            parts.append(chunk)
-        return "".join(parts)
+            buf.write(chunk)
+        return buf.getvalue()
 
     def chat(
         self,
@@ -109,12 +166,12 @@ class Gemini:
                 debug=debug,
                 save_images=save_images,
             )
-            parts: list[str] = []
-            async for chunk in stream:
+            buf = io.StringIO()
+            async for batch in abatch_stream(stream):
                 if on_chunk is not None:
-                    on_chunk(chunk)
-                parts.append(chunk)
-            return "".join(parts)
+                    on_chunk(batch)
+                buf.write(batch)
+            return buf.getvalue()
 
         try:
             asyncio.get_running_loop()
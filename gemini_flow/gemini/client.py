@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from typing import Optional, Sequence, Tuple, Union
 
 from ..cookies import load_google_cookies
 from ..playwright_cookies import ensure_playwright_cookies
 from ..types import AsyncTextStream
+from .protocol import MODEL_HEADERS
 from .provider import GeminiWebProvider
 
 
@@ -19,6 +21,15 @@ class GeminiWebClient:
         client._cookies_dir = cookies_dir
         return client
 
+    async def aclose(self) -> None:
+        await self._provider.aclose()
+
+    async def __aenter__(self) -> "GeminiWebClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
     async def chat(
         self,
         *,
@@ -32,6 +43,10 @@ class GeminiWebClient:
         auto_refresh_cookies: bool = True,
         save_images: bool = True,
     ) -> AsyncTextStream:
+        if model not in MODEL_HEADERS:
+            known = ", ".join(sorted(MODEL_HEADERS))
+            raise ValueError(f"Unknown model: {model!r}. Known models: {known}")
+
         async def _refresh_cookies() -> None:
             await ensure_playwright_cookies(
                 cookies_dir=cookies_dir,
@@ -50,17 +65,27 @@ class GeminiWebClient:
         cookies = await _load_or_refresh()
         image_payload: Optional[list[Tuple[bytes, str]]] = None
         if images:
+            # Pre-supplied bytes go straight in; file reads run concurrently on
+            # threads so the event loop is never blocked on disk I/O.
             image_payload = []
+            pending: list[Tuple[int, Path]] = []
             for item in images:
                 if isinstance(item, tuple) and len(item) == 2 and isinstance(item[0], (bytes, bytearray)):
-                    data = bytes(item[0])
+                    data = item[0] if type(item[0]) is bytes else bytes(item[0])
                     name = str(item[1]) if item[1] else "image.bin"
                     image_payload.append((data, name))
                     continue
 
                 path = Path(item)
-                data = path.read_bytes()
-                image_payload.append((data, path.name))
+                pending.append((len(image_payload), path))
+                image_payload.append((b"", path.name))
+
+            if pending:
+                datas = await asyncio.gather(
+                    *(asyncio.to_thread(path.read_bytes) for _, path in pending)
+                )
+                for (slot, path), data in zip(pending, datas):
+                    image_payload[slot] = (data, path.name)
 
         try:
             return await self._provider.stream_chat(
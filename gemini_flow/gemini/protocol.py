@@ -1,13 +1,34 @@
 from __future__ import annotations
 
+import itertools
 import json
-import random
 import re
+import secrets
 from dataclasses import dataclass
-from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional, Sequence, Tuple
 
 from ..types import GeminiTokens
 
+try:
+    # orjson parses bytes directly with a C/SIMD parser, several times faster
+    # than stdlib json on the per-line streaming hot path.
+    import orjson
+
+    def _json_loads(data: "str | bytes") -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+except ImportError:  # pragma: no cover
+
+    def _json_loads(data: "str | bytes") -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
 
 GEMINI_BASE_URL = "https://gemini.google.com"
 REQUEST_URL = (
@@ -30,7 +51,7 @@ DEFAULT_HEADERS = {
 
 REQUIRED_COOKIE_NAME = "__Secure-1PSID"
 
-MODEL_HEADERS: Dict[str, Dict[str, str]] = {
+MODEL_HEADERS: Dict[str, Mapping[str, str]] = {
     "gemini-3-pro-thinking": {
         "x-goog-ext-525001261-jspb": '[1,null,null,null,"e051ce1aa80aa576",null,null,0,[4],null,null,2]'
     },
@@ -54,8 +75,22 @@ MODEL_HEADERS: Dict[str, Dict[str, str]] = {
     },
 }
 
+# Freeze the per-model header dicts so the shared tables cannot be mutated by
+# callers, and bind the lookup once for the per-request hot path.
+MODEL_HEADERS = {k: MappingProxyType(v) for k, v in MODEL_HEADERS.items()}
+_model_headers_get = MODEL_HEADERS.get
+
+
+# The server only needs _reqid to be unique-ish, not random: one random seed
+# plus a monotonic counter is cheaper than a Random round-trip per request.
+_reqid_counter = itertools.count(secrets.randbelow(9000) + 1111)
+
+
+def _next_reqid() -> str:
+    return str(next(_reqid_counter) % 9000 + 1111)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GeminiRequest:
     prompt: str
     language: str
@@ -67,30 +102,52 @@ class GeminiRequest:
         return {
             "bl": REQUEST_BL_PARAM,
             "hl": self.language,
-            "_reqid": str(random.randint(1111, 9999)),
+            "_reqid": _next_reqid(),
             "rt": "c",
             "f.sid": "" if self.tokens.sid is None else self.tokens.sid,
         }
 
     def data(self) -> Dict[str, str]:
         inner = build_request(self.prompt, self.language, uploads=self.uploads)
+        # Serialize the inner payload once, then embed it directly in the outer
+        # envelope; dumping `[None, inner_json]` would re-escape the whole inner
+        # string a second time. Compact separators also shrink uplink bytes.
+        inner_json = _json_dumps(inner)
         return {
             "at": self.tokens.snlm0e,
-            "f.req": json.dumps([None, json.dumps(inner)]),
+            "f.req": "[null," + _json_dumps(inner_json) + "]",
         }
 
-    def headers(self) -> Optional[Dict[str, str]]:
-        return MODEL_HEADERS.get(self.model)
+    def headers(self) -> Optional[Mapping[str, str]]:
+        return _model_headers_get(self.model)
+
+
+def _find_quoted_value(html: str, anchor: str, terminator: str) -> Optional[str]:
+    """Locate `anchor` and return the text up to the next `terminator`.
+
+    str.find is a single C-level scan, far cheaper than running a regex over a
+    multi-hundred-KB token page.
+    """
+    start = html.find(anchor)
+    if start < 0:
+        return None
+    start += len(anchor)
+    end = html.find(terminator, start)
+    if end < 0:
+        return None
+    return html[start:end]
 
 
 def extract_tokens(html: str) -> Optional[GeminiTokens]:
-    snlm0e_match = re.search(r'SNlM0e\\\":\\\"(.*?)\\\"', html)
-    if not snlm0e_match:
-        snlm0e_match = re.search(r'SNlM0e":"(.*?)"', html)
-    snlm0e = snlm0e_match.group(1) if snlm0e_match else None
+    # The token usually appears escaped inside an inline script; try that
+    # form first, then the plain JSON form.
+    snlm0e = _find_quoted_value(html, 'SNlM0e\\":\\"', '\\"')
+    if snlm0e is None:
+        snlm0e = _find_quoted_value(html, '"SNlM0e":"', '"')
 
-    sid_match = re.search(r'"FdrFJe":"([\d-]+)"', html)
-    sid = sid_match.group(1) if sid_match else None
+    sid = _find_quoted_value(html, '"FdrFJe":"', '"')
+    if sid is not None and not all(c.isdigit() or c == "-" for c in sid):
+        sid = None
 
     if not snlm0e:
         return None
@@ -124,57 +181,97 @@ def build_request(
     ]
 
 
+# Both tree walkers below use an explicit stack instead of recursive
+# generators: response trees can hold hundreds of nodes per line, and a
+# list-based loop avoids a Python frame per node.
+
+
+def _flatten_strings(root: Any) -> list:
+    out: list = []
+    stack = [root]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            if value and not value.startswith("rc_"):
+                out.append(value)
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
+    return out
+
+
+def _walk_strings(root: Any) -> list:
+    out: list = []
+    stack = [root]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            out.append(value)
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
+        elif isinstance(value, dict):
+            stack.extend(reversed(list(value.values())))
+    return out
+
+
 def iter_response_text_chunks(full_text: str) -> Iterator[str]:
+    """Yield text deltas from a fully-buffered response body."""
     last_content = ""
-    for raw_line in full_text.split("\n"):
+    start = 0
+    length = len(full_text)
+    while start <= length:
+        end = full_text.find("\n", start)
+        if end < 0:
+            raw_line, start = full_text[start:], length + 1
+        else:
+            raw_line, start = full_text[start:end], end + 1
         delta, last_content = extract_text_delta_from_raw_line(raw_line, last_content)
         if delta:
             yield delta
 
 
-def extract_text_delta_from_raw_line(raw_line: str, last_content: str) -> Tuple[Optional[str], str]:
+def _extract_content(response_part: Any) -> Optional[str]:
+    # Explicit type/length checks instead of try/except probing: the deep path
+    # misses on most streamed lines, and raising+catching two exceptions per
+    # line is far costlier than these comparisons.
+    if not isinstance(response_part, list) or len(response_part) < 5:
+        return None
+    part = response_part[4]
+    if not isinstance(part, list) or not part:
+        return None
+    head = part[0]
+    if isinstance(head, list) and len(head) >= 2:
+        body = head[1]
+        if isinstance(body, list) and body:
+            first = body[0]
+            if isinstance(first, str):
+                return first
+            if isinstance(first, list) and first and isinstance(first[0], str):
+                return first[0]
+        elif isinstance(body, str):
+            return body
+    candidates = _flatten_strings(part)
+    if candidates:
+        return max(candidates, key=len)
+    return None
+
+
+def extract_text_delta_from_raw_line(
+    raw_line: "str | bytes", last_content: str
+) -> Tuple[Optional[str], str]:
     """Extract incremental text delta from one StreamGenerate response line.
 
+    Accepts the raw line as str or undecoded bytes (the JSON parser handles
+    both, so byte streams skip an intermediate UTF-8 decode).
     Returns (delta, new_last_content). When the line doesn't contain text, returns (None, last_content).
     """
-
-    def _flatten_strings(value):
-        if isinstance(value, str):
-            if value and not value.startswith("rc_"):
-                yield value
-            return
-        if isinstance(value, list):
-            for item in value:
-                yield from _flatten_strings(item)
-
-    def _extract_content(response_part):
-        try:
-            content = response_part[4][0][1][0]
-            if isinstance(content, str):
-                return content
-        except Exception:
-            pass
-
-        try:
-            content = response_part[4][0][1]
-            if isinstance(content, str):
-                return content
-            if isinstance(content, list) and content and isinstance(content[0], str):
-                return content[0]
-        except Exception:
-            pass
-
-        try:
-            candidates = list(_flatten_strings(response_part[4]))
-            if candidates:
-                return max(candidates, key=len)
-        except Exception:
-            pass
-
-        return None
-
+    # StreamGenerate interleaves the JSON envelopes with length-prefix lines
+    # and the ")]}'"" guard; only lines opening with "[" can carry content, so
+    # skip the parser (and its exception on junk) for everything else.
+    first = raw_line[:1]
+    if first != "[" and first != b"[":
+        return None, last_content
     try:
-        line = json.loads(raw_line)
+        line = _json_loads(raw_line)
     except Exception:
         return None, last_content
     if not isinstance(line, list) or not line:
@@ -183,7 +280,7 @@ def extract_text_delta_from_raw_line(raw_line: str, last_content: str) -> Tuple[
     try:
         if len(line[0]) < 3 or not line[0][2]:
             return None, last_content
-        response_part = json.loads(line[0][2])
+        response_part = _json_loads(line[0][2])
         if not response_part or len(response_part) < 5:
             return None, last_content
         content = _extract_content(response_part)
@@ -192,41 +289,45 @@ def extract_text_delta_from_raw_line(raw_line: str, last_content: str) -> Tuple[
     except Exception:
         return None, last_content
 
-    if last_content and content.startswith(last_content):
-        return content[len(last_content) :], content
+    # The server sends cumulative content, so the previous text is almost
+    # always a prefix of the new one. The boundary character is a cheap
+    # pre-filter: when it mismatches, this is a content reset (new candidate)
+    # and the full text is emitted; when it matches, one C-level startswith
+    # confirms the prefix before slicing the delta.
+    last_len = len(last_content)
+    if (
+        last_len
+        and len(content) >= last_len
+        and content[last_len - 1] == last_content[-1]
+        and content.startswith(last_content)
+    ):
+        return content[last_len:], content
     return content, content
 
 
-def extract_image_candidates_from_raw_line(raw_line: str) -> Sequence[str]:
-    """Extract image candidates (URLs or data URLs) from one StreamGenerate raw line."""
+# Heuristic for media references in Gemini web responses: data URLs, known
+# Google media domains anywhere in the URL, or an image-file extension at the
+# end. Compiled once so each candidate costs a single regex pass instead of a
+# cascade of startswith/endswith/in scans.
+_IMAGE_URL_RE = re.compile(
+    r"^(?:data:image/"
+    r"|https?://.*?(?:googleusercontent\.com|gstatic\.com|content-push\.googleapis\.com"
+    r"|\.(?:png|jpe?g|webp)$))",
+    re.IGNORECASE,
+)
+
+
+def _is_likely_image_url(text: str) -> bool:
+    return _IMAGE_URL_RE.match(text) is not None
 
-    def _walk_strings(value: Any) -> Iterator[str]:
-        if isinstance(value, str):
-            yield value
-            return
-        if isinstance(value, list):
-            for item in value:
-                yield from _walk_strings(item)
-            return
-        if isinstance(value, dict):
-            for item in value.values():
-                yield from _walk_strings(item)
-
-    def _is_likely_image_url(text: str) -> bool:
-        if text.startswith("data:image/"):
-            return True
-        if not (text.startswith("https://") or text.startswith("http://")):
-            return False
-        lowered = text.lower()
-        # Heuristics: Gemini web responses often reference these domains for media.
-        if any(d in lowered for d in ["googleusercontent.com", "gstatic.com", "content-push.googleapis.com"]):
-            return True
-        if any(lowered.endswith(ext) for ext in [".png", ".jpg", ".jpeg", ".webp"]):
-            return True
-        return False
 
+def extract_image_candidates_from_raw_line(raw_line: "str | bytes") -> Sequence[str]:
+    """Extract image candidates (URLs or data URLs) from one StreamGenerate raw line."""
+    first = raw_line[:1]
+    if first != "[" and first != b"[":
+        return []
     try:
-        line = json.loads(raw_line)
+        line = _json_loads(raw_line)
     except Exception:
         return []
     if not isinstance(line, list) or not line:
@@ -235,7 +336,7 @@ def extract_image_candidates_from_raw_line(raw_line: str) -> Sequence[str]:
     try:
         if len(line[0]) < 3 or not line[0][2]:
             return []
-        response_part = json.loads(line[0][2])
+        response_part = _json_loads(line[0][2])
     except Exception:
         return []
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-import base64
+import asyncio
+import functools
 import os
 import re
 import sys
@@ -24,8 +25,153 @@ from .protocol import (
 )
 from .upload import upload_images
 
+try:
+    # SIMD-vectorized base64 (4-10x the stdlib's scalar decoder); matters for
+    # multi-MB inline data:image payloads.
+    from pybase64 import b64decode as _b64decode
+except ImportError:  # pragma: no cover
+    from base64 import b64decode as _b64decode
+
+
+# Helpers for the image-mode streaming filter. Hoisted to module scope so each
+# stream_chat call doesn't recompile a regex and rebuild closures/literals for
+# every text delta.
+
+# Control/zero-width characters to strip from candidates; a str.translate
+# table is a single C pass with no regex engine overhead.
+_CONTROL_CHARS = dict.fromkeys(
+    list(range(0x00, 0x20)) + [0x7F, 0x200B, 0x200C, 0x200D, 0xFEFF]
+)
+
+# How long (seconds) an image response may run on a placeholder-only
+# candidate before a "[image pending]" line is emitted for early rendering.
+_FALLBACK_PENDING_DELAY_S = 3.0
+
+# Image-generation model names end in "-image"/"-image-preview" or embed
+# "-image-"; one compiled alternation replaces three substring scans.
+_IMAGE_MODEL_RE = re.compile(r"-image(?:-preview)?$|-image-")
+
+# One compiled alternation instead of three separate `host in url` scans; the
+# regex engine makes a single pass over the candidate.
+_NOISE_HOST_RE = re.compile(
+    r"googleusercontent\.com/image_generation_content/"
+    r"|lh3\.googleusercontent\.com/gg(?:-dl)?/"
+)
+
+_MIME_TO_EXT = {
+    "image/png": "png",
+    "image/jpeg": "jpg",
+    "image/webp": "webp",
+    "image/svg+xml": "svg",
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _image_output_dir(configured: Optional[str]) -> Path:
+    base = Path(configured) if configured else Path("output") / "image"
+    out = base.expanduser()
+    if not out.is_absolute():
+        # absolute() avoids resolve()'s stat-per-path-component syscalls.
+        out = out.absolute()
+    out.mkdir(parents=True, exist_ok=True)
+    return out
+
+
+def _get_image_output_dir() -> Path:
+    # The lru_cache means expanduser/mkdir run once per configured dir instead
+    # of once per image-model request.
+    return _image_output_dir(os.environ.get("GEMINI_FLOW_IMAGE_DIR"))
+
+
+def _normalize_candidate(value: str) -> str:
+    return value.strip().translate(_CONTROL_CHARS)
+
+
+def _is_placeholder_or_input_image(url: str) -> bool:
+    # Placeholder token, not a real downloadable image.
+    if url.startswith("http://googleusercontent.com/image_generation_content/"):
+        return True
+    # Echoed input/uploaded image reference (not the generated output).
+    if "lh3.googleusercontent.com/gg/" in url and "lh3.googleusercontent.com/gg-dl/" not in url:
+        return True
+    return False
+
+
+def _is_output_image_url(url: str) -> bool:
+    if url.startswith("data:image/"):
+        return True
+    if "lh3.googleusercontent.com/gg-dl/" in url:
+        return True
+    return False
+
+
+# First characters that could still make a delta noise: whitespace/control
+# characters (may normalize to empty) or "h"/"H" (http/https URLs). Anything
+# else is ordinary prose and skips the strip/translate/host scans entirely.
+_NOISE_PREFIX_CHARS = frozenset("hH") | frozenset(map(chr, _CONTROL_CHARS))
+
+
+def _is_noise_text_in_image_mode(text: str) -> bool:
+    if not text:
+        return True
+    first = text[0]
+    if first not in _NOISE_PREFIX_CHARS and not first.isspace():
+        return False
+    normalized = _normalize_candidate(text)
+    if not normalized:
+        return True
+    if _is_placeholder_or_input_image(normalized):
+        return True
+    # Some image responses include media URLs in the text delta stream.
+    if normalized.startswith(("http://", "https://")) and _NOISE_HOST_RE.search(normalized):
+        return True
+    return False
+
 
 class GeminiWebProvider(ChatProvider):
+    """Gemini web-flow provider.
+
+    Owns one pooled ``aiohttp.ClientSession`` reused across chats, so repeated
+    requests skip DNS resolution and the TLS handshake. Cookies are passed per
+    request rather than bound to the session, so one session serves all callers.
+    """
+
+    def __init__(self, *, session: Optional[aiohttp.ClientSession] = None):
+        self._session = session
+        self._owns_session = session is None
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=DEFAULT_HEADERS,
+                # Large responses (image models) arrive in multi-MB bursts; a
+                # 4 MiB read buffer avoids both "Chunk too big" errors and a
+                # flood of tiny 64 KiB yields.
+                read_bufsize=2**22,
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=16,
+                    use_dns_cache=True,
+                    # Google edge IPs are stable for far longer than 10 minutes;
+                    # a long TTL keeps warm calls from re-resolving each host.
+                    ttl_dns_cache=600,
+                    keepalive_timeout=75,
+                ),
+            )
+            self._owns_session = True
+        return self._session
+
+    async def aclose(self) -> None:
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "GeminiWebProvider":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
     async def fetch_tokens(
         self,
         *,
@@ -65,8 +211,8 @@ class GeminiWebProvider(ChatProvider):
         if REQUIRED_COOKIE_NAME not in cookies:
             raise MissingAuthError(f"Missing required cookie: {REQUIRED_COOKIE_NAME}")
 
-        async with aiohttp.ClientSession(headers=DEFAULT_HEADERS) as token_session:
-            tokens = await self.fetch_tokens(session=token_session, cookies=cookies, proxy=proxy, debug=debug)
+        session = self._ensure_session()
+        tokens = await self.fetch_tokens(session=session, cookies=cookies, proxy=proxy, debug=debug)
 
         uploads = None
         if images:
@@ -85,62 +231,7 @@ class GeminiWebProvider(ChatProvider):
         )
 
         normalized_model = model.strip().lower()
-        is_image_model = (
-            normalized_model.endswith("-image")
-            or normalized_model.endswith("-image-preview")
-            or "-image-" in normalized_model
-        )
-
-        _CONTROL_RE = re.compile(r"[\x00-\x1F\x7F\u200B\u200C\u200D\uFEFF]")
-
-        def _normalize_candidate(value: str) -> str:
-            value = value.strip()
-            value = _CONTROL_RE.sub("", value)
-            return value
-
-        def _is_placeholder_or_input_image(url: str) -> bool:
-            # Placeholder token, not a real downloadable image.
-            if url.startswith("http://googleusercontent.com/image_generation_content/"):
-                return True
-            # Echoed input/uploaded image reference (not the generated output).
-            if "lh3.googleusercontent.com/gg/" in url and "lh3.googleusercontent.com/gg-dl/" not in url:
-                return True
-            return False
-
-        def _is_output_image_url(url: str) -> bool:
-            if url.startswith("data:image/"):
-                return True
-            if "lh3.googleusercontent.com/gg-dl/" in url:
-                return True
-            return False
-
-        def _is_noise_text_in_image_mode(text: str) -> bool:
-            normalized = _normalize_candidate(text)
-            if not normalized:
-                return True
-            if _is_placeholder_or_input_image(normalized):
-                return True
-            # Some image responses include media URLs in the text delta stream.
-            if normalized.startswith("http://") or normalized.startswith("https://"):
-                if any(
-                    host in normalized
-                    for host in [
-                        "googleusercontent.com/image_generation_content/",
-                        "lh3.googleusercontent.com/gg-dl/",
-                        "lh3.googleusercontent.com/gg/",
-                    ]
-                ):
-                    return True
-            return False
-
-        def _get_image_output_dir() -> Path:
-            configured = os.environ.get("GEMINI_FLOW_IMAGE_DIR")
-            base = Path(configured) if configured else Path("output") / "image"
-            out = base.expanduser()
-            if not out.is_absolute():
-                out = (Path.cwd() / out).resolve()
-            out.mkdir(parents=True, exist_ok=True)
-            return out
+        is_image_model = _IMAGE_MODEL_RE.search(normalized_model) is not None
 
         async def _save_image_candidate(
             *,
@@ -153,110 +244,75 @@ class GeminiWebProvider(ChatProvider):
                 try:
                     header, b64 = candidate.split(",", 1)
                     mime = header.split(";", 1)[0].split(":", 1)[1]
-                    ext = {
-                        "image/png": "png",
-                        "image/jpeg": "jpg",
-                        "image/webp": "webp",
-                        "image/svg+xml": "svg",
-                    }.get(mime, "png")
-                    data = base64.b64decode(b64)
+                    ext = _MIME_TO_EXT.get(mime, "png")
+                    data = _b64decode(b64, validate=False)
                 except Exception:
                     return None
 
                 out_path = out_dir / f"{suffix}.{ext}"
-                out_path.write_bytes(data)
+                await asyncio.to_thread(out_path.write_bytes, data)
                 return out_path
 
-            if not (candidate.startswith("https://") or candidate.startswith("http://")):
+            if not candidate.startswith(("https://", "http://")):
                 return None
 
+            # Stream straight to disk: peak memory stays flat regardless of
+            # image size, and the blocking writes run off the event loop.
+            out_path = None
             try:
-                async with client.get(candidate, proxy=proxy) as resp:
+                async with client.get(candidate, cookies=cookies, proxy=proxy) as resp:
                     if resp.status >= 400:
                         return None
-                    data = await resp.read()
-                    content_type = (resp.headers.get("Content-Type") or "").split(";", 1)[0].strip().lower()
+                    # Prefer the extension already present in the URL; only
+                    # fall back to the Content-Type header when there is none.
+                    url_path = candidate.partition("?")[0].partition("#")[0].lower()
+                    if url_path.endswith((".png", ".jpg", ".jpeg", ".webp", ".svg")):
+                        ext = url_path.rpartition(".")[2]
+                    else:
+                        content_type = (resp.headers.get("Content-Type") or "").split(";", 1)[0].strip().lower()
+                        ext = _MIME_TO_EXT.get(content_type, "png")
+                    out_path = out_dir / f"{suffix}.{ext}"
+                    with open(out_path, "wb") as f:
+                        async for chunk in resp.content.iter_chunked(65536):
+                            await asyncio.to_thread(f.write, chunk)
             except Exception:
+                if out_path is not None:
+                    out_path.unlink(missing_ok=True)
                 return None
 
-            ext = {
-                "image/png": "png",
-                "image/jpeg": "jpg",
-                "image/webp": "webp",
-                "image/svg+xml": "svg",
-            }.get(content_type, "png")
-            out_path = out_dir / f"{suffix}.{ext}"
-            out_path.write_bytes(data)
             return out_path
 
         async def gen():
             emitted_any = False
-            preview = ""
-            buffer = ""
+            # Raw-bytes preview window; formatting (CR strip, decode) happens
+            # once at print time instead of per chunk.
+            preview = bytearray()
+            # Bytes-level buffer: extending a bytearray and deleting consumed
+            # prefixes in place avoids the O(n^2) str re-concatenation of
+            # `buffer += part` / `buffer.split("\n", 1)` on long streams, and
+            # each line is only decoded by the JSON parser itself.
+            buffer = bytearray()
             last_content = ""
             final_image_candidate: Optional[str] = None
             fallback_image_candidate: Optional[str] = None
             out_dir = _get_image_output_dir() if is_image_model else Path.cwd()
-            out_prefix = f"gemini_{model}_{int(time.time())}"
+            # The stamp only needs to keep filenames unique, not track wall
+            # clock: monotonic_ns is a vDSO read, cheaper than time.time().
+            out_prefix = f"gemini_{model}_{time.monotonic_ns() // 1_000_000}"
             out_index = 0
-
-            async with aiohttp.ClientSession(headers=DEFAULT_HEADERS, cookies=cookies) as client:
-                try:
-                    async with client.post(
-                        REQUEST_URL,
-                        params=req.params(),
-                        data=req.data(),
-                        headers=req.headers(),
-                        proxy=proxy,
-                    ) as resp:
-                        if resp.status >= 400:
-                            body = await resp.text()
-                            raise RequestError(
-                                f"StreamGenerate failed: HTTP {resp.status} body={body[:300]}"
-                            )
-
-                        async for chunk in resp.content.iter_any():
-                            try:
-                                part = chunk.decode("utf-8", errors="ignore")
-                            except Exception:
-                                continue
-
-                            if debug and len(preview) < 800:
-                                preview += part[: (800 - len(preview))].replace("\r", "")
-
-                            buffer += part
-                            while "\n" in buffer:
-                                raw_line, buffer = buffer.split("\n", 1)
-                                raw_line = raw_line.rstrip("\r")
-
-                                if is_image_model:
-                                    for candidate in extract_image_candidates_from_raw_line(raw_line):
-                                        normalized = _normalize_candidate(candidate)
-                                        if not normalized:
-                                            continue
-                                        if _is_placeholder_or_input_image(normalized):
-                                            if fallback_image_candidate is None:
-                                                fallback_image_candidate = normalized
-                                            continue
-                                        if _is_output_image_url(normalized):
-                                            # Keep only the latest output candidate; save once at the end.
-                                            final_image_candidate = normalized
-
-                                delta, last_content = extract_text_delta_from_raw_line(
-                                    raw_line, last_content
-                                )
-                                if delta:
-                                    if not is_image_model or not _is_noise_text_in_image_mode(delta):
-                                        emitted_any = True
-                                        yield delta
-
-                except aiohttp.ClientError as e:
-                    raise RequestError(f"StreamGenerate request failed: {e}") from e
-
-            if buffer.strip():
-                raw_line = buffer.rstrip("\r")
-
-                if is_image_model:
+            loop = asyncio.get_running_loop()
+            fallback_seen_at: Optional[float] = None
+            fallback_announced = False
+
+            def _handle_line(raw_line: bytes) -> Optional[str]:
+                nonlocal last_content, final_image_candidate, fallback_image_candidate
+                nonlocal fallback_seen_at
+                # Cheap bytes scan before the JSON-aware extractor: only lines
+                # that can actually contain a media reference (data URLs or
+                # googleusercontent placeholders/outputs) are worth walking.
+                if is_image_model and (
+                    b"data:image/" in raw_line or b"googleusercontent.com/" in raw_line
+                ):
                     for candidate in extract_image_candidates_from_raw_line(raw_line):
                         normalized = _normalize_candidate(candidate)
                         if not normalized:
@@ -264,28 +320,84 @@ class GeminiWebProvider(ChatProvider):
                         if _is_placeholder_or_input_image(normalized):
                             if fallback_image_candidate is None:
                                 fallback_image_candidate = normalized
+                                fallback_seen_at = loop.time()
                             continue
                         if _is_output_image_url(normalized):
+                            # Keep only the latest output candidate; save once at the end.
                             final_image_candidate = normalized
 
                 delta, last_content = extract_text_delta_from_raw_line(raw_line, last_content)
+                if delta and (not is_image_model or not _is_noise_text_in_image_mode(delta)):
+                    return delta
+                return None
+
+            try:
+                async with session.post(
+                    REQUEST_URL,
+                    params=req.params(),
+                    data=req.data(),
+                    headers=req.headers(),
+                    cookies=cookies,
+                    proxy=proxy,
+                ) as resp:
+                    if resp.status >= 400:
+                        body = await resp.text()
+                        raise RequestError(
+                            f"StreamGenerate failed: HTTP {resp.status} body={body[:300]}"
+                        )
+
+                    # iter_chunks yields whatever the transport delivered
+                    # without re-chunking into fixed-size pieces.
+                    async for chunk, _ in resp.content.iter_chunks():
+                        if debug and len(preview) < 800:
+                            preview.extend(chunk[: 800 - len(preview)])
+
+                        buffer += chunk
+                        while True:
+                            newline = buffer.find(b"\n")
+                            if newline < 0:
+                                break
+                            raw_line = bytes(buffer[:newline]).rstrip(b"\r")
+                            del buffer[: newline + 1]
+                            delta = _handle_line(raw_line)
+                            if delta:
+                                emitted_any = True
+                                yield delta
+
+                        # If only a placeholder has shown up for a while, let
+                        # the caller render something now instead of waiting
+                        # for the whole stream to close.
+                        if (
+                            is_image_model
+                            and not fallback_announced
+                            and final_image_candidate is None
+                            and fallback_seen_at is not None
+                            and loop.time() - fallback_seen_at >= _FALLBACK_PENDING_DELAY_S
+                        ):
+                            fallback_announced = True
+                            emitted_any = True
+                            yield f"[image pending] {fallback_image_candidate}\n"
+
+            except aiohttp.ClientError as e:
+                raise RequestError(f"StreamGenerate request failed: {e}") from e
+
+            if buffer.strip():
+                delta = _handle_line(bytes(buffer).rstrip(b"\r"))
                 if delta:
-                    if not is_image_model or not _is_noise_text_in_image_mode(delta):
-                        emitted_any = True
-                        yield delta
+                    emitted_any = True
+                    yield delta
 
             if is_image_model and final_image_candidate:
                 if save_images:
                     out_index += 1
-                    # NOTE: At this point the streaming client session has been closed.
-                    # Use a fresh session for downloading the final image.
-                    async with aiohttp.ClientSession(headers=DEFAULT_HEADERS, cookies=cookies) as download_client:
-                        saved = await _save_image_candidate(
-                            client=download_client,
-                            candidate=final_image_candidate,
-                            out_dir=out_dir,
-                            suffix=f"{out_prefix}_{out_index}",
-                        )
+                    # The shared session outlives the streaming response, so the
+                    # download reuses its warm connection pool.
+                    saved = await _save_image_candidate(
+                        client=session,
+                        candidate=final_image_candidate,
+                        out_dir=out_dir,
+                        suffix=f"{out_prefix}_{out_index}",
+                    )
                     emitted_any = True
                     if saved:
                         yield f"[image saved] {saved}\n"
@@ -301,8 +413,9 @@ class GeminiWebProvider(ChatProvider):
 
             if not emitted_any:
                 if debug and preview:
+                    preview_text = bytes(preview).replace(b"\r", b"").decode("utf-8", "ignore")
                     print(
-                        f"[debug] StreamGenerate response preview (first 800 chars):\n{preview}\n",
+                        f"[debug] StreamGenerate response preview (first 800 chars):\n{preview_text}\n",
                         file=sys.stderr,
                     )
                 raise RequestError(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from dataclasses import dataclass
 from pathlib import Path
@@ -21,13 +22,10 @@ class PlaywrightCookieRefreshResult:
 
 
 def _has_required_cookie(cookie_export: Sequence[dict]) -> bool:
-    for c in cookie_export:
-        try:
-            if c.get("name") == REQUIRED_COOKIE_NAME and c.get("value"):
-                return True
-        except Exception:
-            continue
-    return False
+    return any(
+        isinstance(c, dict) and c.get("name") == REQUIRED_COOKIE_NAME and c.get("value")
+        for c in cookie_export
+    )
 
 
 def _looks_like_login_redirect(url: str) -> bool:
@@ -94,9 +92,11 @@ async def export_gemini_cookies_with_playwright_async(
                     cookie_count=len(cookie_export),
                 )
 
-            cookies_path.write_text(
-                json.dumps(cookie_export, ensure_ascii=False, indent=2),
-                encoding="utf-8",
+            # Compact separators keep the export small, and the blocking write
+            # runs on a thread so the event loop stays responsive.
+            await asyncio.to_thread(
+                cookies_path.write_bytes,
+                json.dumps(cookie_export, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
             )
             return PlaywrightCookieRefreshResult(
                 ok=True,
@@ -140,6 +140,9 @@ async def ensure_playwright_cookies(
     result = await _try_export(headless=True)
     if result.ok:
         print("[info] Gemini cookies refreshed successfully (headless).")
+        from .cookies import clear_cookie_cache
+
+        clear_cookie_cache()
         return cookies_path
 
     raise MissingAuthError(
@@ -2,12 +2,17 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import base64
 import binascii
+import itertools
 import json
+import logging
+import os
+import secrets
+import sys
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Optional, Tuple
-from uuid import uuid4
 
 import aiohttp
 import aiohttp_cors
@@ -15,26 +20,77 @@ from aiohttp import web
 
 from gemini_flow import Gemini
 from gemini_flow.cookies import load_google_cookies
+from gemini_flow.gemini.protocol import MODEL_HEADERS
 
+logger = logging.getLogger("gemini_flow.server")
 
-def _json_dumps(obj: object) -> str:
-    return json.dumps(obj, ensure_ascii=False)
+try:
+    # orjson parses bytes directly and serializes straight to UTF-8 bytes,
+    # which keeps /chat body parsing and per-chunk SSE framing off the
+    # stdlib's str round-trips.
+    import orjson
+
+    def _json_loads(data: "str | bytes") -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps_bytes(obj: object) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:  # pragma: no cover
+
+    def _json_loads(data: "str | bytes") -> Any:
+        return json.loads(data)
+
+    def _json_dumps_bytes(obj: object) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+try:
+    # pybase64 uses SIMD base64 kernels, a large win on multi-MB data URLs.
+    from pybase64 import b64decode as _b64decode, b64encode as _b64encode
+except ImportError:  # pragma: no cover
+    from base64 import b64decode as _b64decode, b64encode as _b64encode
+
+
+# json_response(dumps=...) serializes to str and leaves aiohttp to encode it
+# again; building the body bytes once avoids that second pass per response.
+_JSON_HDRS = {"Content-Type": "application/json; charset=utf-8"}
+
+
+def _json_response(obj: object, *, status: int = 200) -> web.Response:
+    return web.Response(body=_json_dumps_bytes(obj), status=status, headers=_JSON_HDRS)
 
 
 def _json_error(message: str, *, status: int = 400) -> web.Response:
-    return web.json_response({"error": message}, status=status, dumps=_json_dumps)
+    return _json_response({"error": message}, status=status)
+
+
+# cp950/big5 JSON bodies are not spec-compliant; the retry loop that decoded
+# them cost up to three wasted decodes per malformed body. Opt back in with
+# GEMINI_FLOW_LEGACY_ENCODINGS=1 if a legacy client still sends them.
+_LEGACY_ENCODINGS = ("cp950", "big5") if os.environ.get("GEMINI_FLOW_LEGACY_ENCODINGS") == "1" else ()
 
 
 async def _read_json_object(request: web.Request) -> dict[str, Any]:
     raw = await request.read()
     if not raw:
         raise ValueError("empty request body")
+    if raw[:3] == b"\xef\xbb\xbf":
+        raw = raw[3:]
 
     last_error: Optional[Exception] = None
-    for encoding in ("utf-8", "utf-8-sig", "cp950", "big5"):
+    try:
+        obj = _json_loads(raw)
+    except Exception as e:
+        last_error = e
+    else:
+        if isinstance(obj, dict):
+            return obj
+        last_error = ValueError("body must be a JSON object")
+
+    for encoding in _LEGACY_ENCODINGS:
         try:
-            text = raw.decode(encoding)
-            obj = json.loads(text)
+            obj = json.loads(raw.decode(encoding))
             if not isinstance(obj, dict):
                 raise ValueError("body must be a JSON object")
             return obj
@@ -48,46 +104,93 @@ async def _read_json_object(request: web.Request) -> dict[str, Any]:
     ) from last_error
 
 
+# Whitespace bytes stripped from base64 payloads before decoding.
+_B64_WS = b" \t\r\n\x0b\x0c"
+
+
 def _normalize_base64(data: str) -> str:
-    compact = "".join(data.split())
+    # translate() deletes whitespace in one C-level pass over the bytes,
+    # instead of split() building a list of fragments and join() re-copying
+    # them — a noticeable saving on multi-MB data URLs.
+    compact = data.encode("ascii", "ignore").translate(None, _B64_WS)
     padding = (-len(compact)) % 4
     if padding:
-        compact += "=" * padding
-    return compact
+        compact += b"=" * padding
+    return compact.decode("ascii")
+
+
+_MIME_TO_EXT = {
+    "image/png": "png",
+    "image/jpeg": "jpg",
+    "image/webp": "webp",
+}
 
 
 def _decode_base64_image(value: str, *, index: int) -> Tuple[bytes, str]:
     if value.startswith("data:image/"):
-        header, b64 = value.split(",", 1)
-        mime = header.split(";", 1)[0].split(":", 1)[1].lower()
-        ext = {
-            "image/png": "png",
-            "image/jpeg": "jpg",
-            "image/webp": "webp",
-        }.get(mime, "png")
-        payload = _normalize_base64(b64)
+        # Locate the separators by index instead of split(): the old
+        # three-way split copied the whole multi-MB payload just to pull a
+        # short MIME type out of the header.
+        comma = value.find(",")
+        if comma < 0:
+            raise ValueError(f"images[{index}] invalid base64 data URL")
+        mime_end = value.find(";", 5, comma)
+        mime = value[5 : mime_end if mime_end >= 0 else comma].lower()
+        ext = _MIME_TO_EXT.get(mime, "png")
+        payload = _normalize_base64(value[comma + 1 :])
         try:
-            data = base64.b64decode(payload, validate=False)
+            data = _b64decode(payload, validate=False)
         except binascii.Error as e:
             raise ValueError(f"images[{index}] invalid base64 data URL") from e
         return data, f"upload_{index + 1}.{ext}"
 
     payload = _normalize_base64(value)
     try:
-        data = base64.b64decode(payload, validate=False)
+        data = _b64decode(payload, validate=False)
     except binascii.Error as e:
         raise ValueError(f"images[{index}] invalid base64 string") from e
     return data, f"upload_{index + 1}.png"
 
 
+# Gemini can repeat the same image URL across retries/regenerations; a small
+# in-process LRU skips the re-download entirely. Oversized payloads are never
+# cached so the cache stays within a modest byte budget. Per-URL locks
+# coalesce concurrent requests for one URL into a single fetch.
+_URL_B64_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_URL_B64_CACHE_MAX = 256
+_URL_B64_ITEM_MAX = 4 * 1024 * 1024
+_URL_B64_LOCKS: dict[str, asyncio.Lock] = {}
+
+
+def _url_cache_get(url: str) -> Optional[str]:
+    cached = _URL_B64_CACHE.get(url)
+    if cached is not None:
+        _URL_B64_CACHE.move_to_end(url)
+    return cached
+
+
+def _url_cache_put(url: str, b64: str) -> None:
+    if len(b64) > _URL_B64_ITEM_MAX:
+        return
+    _URL_B64_CACHE[url] = b64
+    if len(_URL_B64_CACHE) > _URL_B64_CACHE_MAX:
+        _URL_B64_CACHE.popitem(last=False)
+
+
 async def _image_url_to_base64(
     url: str,
     *,
     session: aiohttp.ClientSession,
+    cookies: Optional[dict[str, str]] = None,
 ) -> Optional[str]:
     if url.startswith("data:image/"):
         try:
             _, b64 = url.split(",", 1)
+            # Most data URLs arrive already compact and padded; this scan is
+            # cheaper than _normalize_base64's encode/translate pass and must
+            # reject every character that pass would strip.
+            if len(b64) % 4 == 0 and not any(c.isspace() for c in b64):
+                return b64
             return _normalize_base64(b64)
         except Exception:
             return None
@@ -95,15 +198,39 @@ async def _image_url_to_base64(
     if not (url.startswith("http://") or url.startswith("https://")):
         return None
 
+    cached = _url_cache_get(url)
+    if cached is not None:
+        return cached
+
+    lock = _URL_B64_LOCKS.setdefault(url, asyncio.Lock())
     try:
-        async with session.get(url) as resp:
-            if resp.status >= 400:
+        async with lock:
+            cached = _url_cache_get(url)
+            if cached is not None:
+                return cached
+            try:
+                async with session.get(url, cookies=cookies) as resp:
+                    if resp.status >= 400:
+                        return None
+                    data = await resp.read()
+            except Exception:
                 return None
-            data = await resp.read()
-    except Exception:
-        return None
 
-    return base64.b64encode(data).decode("ascii")
+            b64 = _b64encode(data).decode("ascii")
+            _url_cache_put(url, b64)
+            return b64
+    finally:
+        _URL_B64_LOCKS.pop(url, None)
+
+
+# Marker prefixes emitted by the provider stream. The handlers test the
+# common "[image" stem once, so plain text chunks pay a single startswith
+# instead of one per marker.
+_IMG_STEM = "[image"
+_IMG_SAVED_PREFIX = "[image saved] "
+_IMG_URL_PREFIX = "[image url] "
+_IMG_PREFIX = "[image] "
+_IMG_PENDING_PREFIX = "[image pending] "
 
 
 def _load_download_cookies() -> Optional[dict[str, str]]:
@@ -117,10 +244,26 @@ def _parse_images(payload: dict[str, Any]) -> Optional[list[Tuple[bytes, str]]]:
     images = payload.get("images")
     if images is None:
         return None
-    if not isinstance(images, list) or not all(isinstance(x, str) for x in images):
+    if not isinstance(images, list):
         raise ValueError("images must be a list of base64 strings")
 
-    return [_decode_base64_image(value, index=i) for i, value in enumerate(images)]
+    # Validate while decoding: one pass over the list, and a wrong element
+    # aborts immediately instead of after a full all()/isinstance sweep.
+    decoded: list[Tuple[bytes, str]] = []
+    for i, value in enumerate(images):
+        if type(value) is not str:
+            raise ValueError("images must be a list of base64 strings")
+        decoded.append(_decode_base64_image(value, index=i))
+    return decoded
+
+
+# Log tags only need to be unique-ish: a randomly seeded counter gives the
+# same 8-hex-char tag as uuid4().hex[:8] without a CSPRNG call per request.
+_request_id_counter = itertools.count(secrets.randbits(32))
+
+
+def _next_request_id() -> str:
+    return f"{next(_request_id_counter) & 0xFFFFFFFF:08x}"
 
 
 def _payload_model(payload: dict[str, Any]) -> str:
@@ -135,6 +278,37 @@ def _payload_has_images(payload: dict[str, Any]) -> bool:
     return isinstance(images, list) and len(images) > 0
 
 
+# The handful of (model, language, auto_refresh_cookies) combos in real
+# traffic map to a handful of Gemini instances; reusing them amortizes
+# construction and lets the underlying provider keep its warm HTTP session
+# across requests. Models are validated against MODEL_HEADERS before
+# anything is cached, and the cache is a bounded LRU — language is free-form
+# client input, so an unbounded dict would grow with every typo. Evicted
+# instances are closed so no session leaks.
+_GEMINI_CACHE: "OrderedDict[Tuple[str, str, bool], Gemini]" = OrderedDict()
+_GEMINI_CACHE_MAX = 32
+
+
+async def _cached_gemini(model: str, language: str, auto_refresh_cookies: bool) -> Gemini:
+    if model not in MODEL_HEADERS:
+        known = ", ".join(sorted(MODEL_HEADERS))
+        raise ValueError(f"Unknown model: {model!r}. Known models: {known}")
+
+    key = (model, language, auto_refresh_cookies)
+    ai = _GEMINI_CACHE.get(key)
+    if ai is not None:
+        _GEMINI_CACHE.move_to_end(key)
+        return ai
+
+    ai = _GEMINI_CACHE[key] = Gemini(
+        model=model, language=language, auto_refresh_cookies=auto_refresh_cookies
+    )
+    if len(_GEMINI_CACHE) > _GEMINI_CACHE_MAX:
+        _, evicted = _GEMINI_CACHE.popitem(last=False)
+        await evicted.aclose()
+    return ai
+
+
 async def _run_gemini_stream(*, payload: dict[str, Any]):
     prompt = payload.get("prompt")
     if not isinstance(prompt, str) or not prompt.strip():
@@ -156,26 +330,29 @@ async def _run_gemini_stream(*, payload: dict[str, Any]):
     if not isinstance(auto_refresh_cookies, bool):
         raise ValueError("auto_refresh_cookies must be a boolean")
 
-    images = _parse_images(payload)
+    # Multi-MB base64 decodes would stall every other request if they ran on
+    # the event loop thread; push them to a worker thread (pybase64 releases
+    # the GIL during the decode). Image-less payloads skip the thread hop.
+    if _payload_has_images(payload):
+        images = await asyncio.to_thread(_parse_images, payload)
+    else:
+        images = _parse_images(payload)
 
-    ai = Gemini(
-        model=model or "gemini-3-pro",
-        language=language or "zh-TW",
-        auto_refresh_cookies=auto_refresh_cookies,
-    )
+    # The cached instance is keyed by (model, language), so its defaults are
+    # already the requested values; re-passing them per call would just make
+    # astream_chat resolve the same overrides again.
+    ai = await _cached_gemini(model or "gemini-3-pro", language or "zh-TW", auto_refresh_cookies)
 
     stream = await ai.astream_chat(
         prompt,
-        model=model,
         images=images,
-        language=language,
         save_images=False,
     )
     return stream
 
 
 async def health(_: web.Request) -> web.Response:
-    return web.json_response({"ok": True}, dumps=_json_dumps)
+    return _json_response({"ok": True})
 
 
 async def chat(request: web.Request) -> web.Response:
@@ -184,64 +361,140 @@ async def chat(request: web.Request) -> web.Response:
     except Exception as e:
         return _json_error(str(e))
 
-    request_id = uuid4().hex[:8]
-    try:
-        print(
-            f"[server] id={request_id} /chat recv model={_payload_model(payload)} has_images={_payload_has_images(payload)}"
-        )
-    except Exception:
-        print(f"[server] id={request_id} /chat recv <unprintable>")
+    request_id = _next_request_id()
+    logger.info(
+        "id=%s /chat recv model=%s has_images=%s",
+        request_id,
+        _payload_model(payload),
+        _payload_has_images(payload),
+    )
 
     try:
         stream = await _run_gemini_stream(payload=payload)
     except Exception as e:
         return _json_error(str(e), status=400)
 
-    text_parts: list[str] = []
-    images_saved: list[str] = []
+    # Text accumulates as UTF-8 straight into one growable buffer, so the
+    # handler keeps no per-chunk str objects and skips the final join pass.
+    text_buf = bytearray()
+    # Slots keep arrival order while the downloads themselves run
+    # concurrently: each URL reserves its position and a task; gather()
+    # overlaps the fetch round-trips instead of serializing them.
+    images_saved: list[Optional[str]] = []
+    pending: list[Tuple[int, "asyncio.Task[Optional[str]]"]] = []
 
     cookies = _load_download_cookies()
-    async with aiohttp.ClientSession(cookies=cookies) as http_session:
-        try:
-            async for chunk in stream:
-                if isinstance(chunk, str) and chunk.startswith("[image saved] "):
-                    path = chunk[len("[image saved] ") :].strip()
+    http_session = request.app["http_session"]
+    try:
+        async for chunk in stream:
+            if not isinstance(chunk, str):
+                text_buf += str(chunk).encode("utf-8")
+                continue
+            if chunk.startswith(_IMG_STEM):
+                if chunk.startswith(_IMG_SAVED_PREFIX):
+                    path = chunk[len(_IMG_SAVED_PREFIX) :].strip()
                     if path:
                         images_saved.append(path)
                     continue
-                if isinstance(chunk, str) and chunk.startswith("[image url] "):
-                    url = chunk[len("[image url] ") :].strip()
+                if chunk.startswith(_IMG_URL_PREFIX):
+                    url = chunk[len(_IMG_URL_PREFIX) :].strip()
                     if url:
-                        b64 = await _image_url_to_base64(url, session=http_session)
-                        if b64:
-                            images_saved.append(b64)
+                        images_saved.append(None)
+                        pending.append(
+                            (
+                                len(images_saved) - 1,
+                                asyncio.create_task(
+                                    _image_url_to_base64(url, session=http_session, cookies=cookies)
+                                ),
+                            )
+                        )
                     continue
-                if isinstance(chunk, str) and chunk.startswith("[image] "):
-                    candidate = chunk[len("[image] ") :].strip()
+                if chunk.startswith(_IMG_PREFIX):
+                    candidate = chunk[len(_IMG_PREFIX) :].strip()
                     if candidate:
-                        b64 = await _image_url_to_base64(candidate, session=http_session)
-                        if b64:
-                            images_saved.append(b64)
+                        images_saved.append(None)
+                        pending.append(
+                            (
+                                len(images_saved) - 1,
+                                asyncio.create_task(
+                                    _image_url_to_base64(candidate, session=http_session, cookies=cookies)
+                                ),
+                            )
+                        )
                     continue
-                text_parts.append(str(chunk))
-        except Exception as e:
-            return _json_error(str(e), status=500)
+                if chunk.startswith(_IMG_PENDING_PREFIX):
+                    # Transient placeholder; the final image follows as its
+                    # own marker, so nothing useful belongs in the text.
+                    continue
+            text_buf += chunk.encode("utf-8")
 
-    response_payload = {"text": "".join(text_parts), "images": images_saved}
-    try:
-        print(
-            f"[server] id={request_id} /chat resp has_text={bool(response_payload['text'])} "
-            f"has_images={bool(response_payload['images'])}"
-        )
-    except Exception:
-        print(f"[server] id={request_id} /chat resp <unprintable>")
+        if pending:
+            results = await asyncio.gather(*(task for _, task in pending))
+            for (slot, _), b64 in zip(pending, results):
+                images_saved[slot] = b64
+        images_saved = [item for item in images_saved if item]
+    except Exception as e:
+        for _, task in pending:
+            task.cancel()
+        return _json_error(str(e), status=500)
+
+    response_payload = {"text": text_buf.decode("utf-8"), "images": images_saved}
+    logger.info(
+        "id=%s /chat resp has_text=%s has_images=%s",
+        request_id,
+        bool(response_payload["text"]),
+        bool(response_payload["images"]),
+    )
 
-    return web.json_response(response_payload, dumps=_json_dumps)
+    return _json_response(response_payload)
 
 
 def _sse_format(*, event: str, data: object) -> bytes:
-    payload = json.dumps(data, ensure_ascii=False)
-    return f"event: {event}\ndata: {payload}\n\n".encode("utf-8")
+    # Frame directly in bytes: serializing with _json_dumps_bytes skips the
+    # json.dumps -> str -> encode round-trip on every streamed chunk.
+    return b"event: " + event.encode("ascii") + b"\ndata: " + _json_dumps_bytes(data) + b"\n\n"
+
+
+# Text frames all share the same shape, so the framing around the payload is
+# encoded once at import; per chunk only the string itself is serialized.
+_SSE_TEXT_PREFIX = b'event: text\ndata: {"chunk":'
+_SSE_SUFFIX = b"}\n\n"
+
+
+def _sse_format_text(chunk: str) -> bytes:
+    return _SSE_TEXT_PREFIX + _json_dumps_bytes(chunk) + _SSE_SUFFIX
+
+
+class _SseBatcher:
+    """Coalesces adjacent SSE text frames into one write.
+
+    A long reply streams thousands of token-sized chunks; writing each one
+    individually costs a send() per token. Frames accumulate until the buffer
+    reaches ``max_bytes`` or ``max_delay`` seconds have passed since the last
+    flush, whichever comes first, so latency stays bounded while most writes
+    carry many frames.
+    """
+
+    __slots__ = ("_resp", "_buf", "_max_bytes", "_max_delay", "_last_flush")
+
+    def __init__(self, resp: web.StreamResponse, *, max_bytes: int = 4096, max_delay: float = 0.01):
+        self._resp = resp
+        self._buf = bytearray()
+        self._max_bytes = max_bytes
+        self._max_delay = max_delay
+        self._last_flush = time.monotonic()
+
+    async def push(self, frame: bytes) -> None:
+        self._buf += frame
+        if len(self._buf) >= self._max_bytes or time.monotonic() - self._last_flush >= self._max_delay:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if self._buf:
+            data = bytes(self._buf)
+            self._buf.clear()
+            await self._resp.write(data)
+        self._last_flush = time.monotonic()
 
 
 async def stream(request: web.Request) -> web.StreamResponse:
@@ -250,13 +503,13 @@ async def stream(request: web.Request) -> web.StreamResponse:
     except Exception as e:
         return web.Response(status=400, text=str(e))
 
-    request_id = uuid4().hex[:8]
-    try:
-        print(
-            f"[server] id={request_id} /stream recv model={_payload_model(payload)} has_images={_payload_has_images(payload)}"
-        )
-    except Exception:
-        print(f"[server] id={request_id} /stream recv <unprintable>")
+    request_id = _next_request_id()
+    logger.info(
+        "id=%s /stream recv model=%s has_images=%s",
+        request_id,
+        _payload_model(payload),
+        _payload_has_images(payload),
+    )
 
     resp = web.StreamResponse(
         status=200,
@@ -273,38 +526,49 @@ async def stream(request: web.Request) -> web.StreamResponse:
         cookies = _load_download_cookies()
         has_text = False
         has_images = False
-        async with aiohttp.ClientSession(cookies=cookies) as http_session:
-            async for chunk in gemini_stream:
-                if isinstance(chunk, str) and chunk.startswith("[image saved] "):
-                    path = chunk[len("[image saved] ") :].strip()
+        http_session = request.app["http_session"]
+        batcher = _SseBatcher(resp)
+        async for chunk in gemini_stream:
+            if isinstance(chunk, str) and chunk.startswith(_IMG_STEM):
+                if chunk.startswith(_IMG_SAVED_PREFIX):
+                    path = chunk[len(_IMG_SAVED_PREFIX) :].strip()
                     has_images = True
+                    await batcher.flush()
                     await resp.write(_sse_format(event="image", data={"path": path}))
-                elif isinstance(chunk, str) and chunk.startswith("[image url] "):
-                    url = chunk[len("[image url] ") :].strip()
-                    b64 = await _image_url_to_base64(url, session=http_session) if url else None
+                    continue
+                if chunk.startswith(_IMG_URL_PREFIX):
+                    url = chunk[len(_IMG_URL_PREFIX) :].strip()
+                    b64 = await _image_url_to_base64(url, session=http_session, cookies=cookies) if url else None
+                    await batcher.flush()
                     if b64:
                         has_images = True
                         await resp.write(_sse_format(event="image", data={"base64": b64}))
                     else:
                         await resp.write(_sse_format(event="image", data={"base64": ""}))
-                elif isinstance(chunk, str) and chunk.startswith("[image] "):
-                    candidate = chunk[len("[image] ") :].strip()
-                    b64 = await _image_url_to_base64(candidate, session=http_session) if candidate else None
+                    continue
+                if chunk.startswith(_IMG_PREFIX):
+                    candidate = chunk[len(_IMG_PREFIX) :].strip()
+                    b64 = await _image_url_to_base64(candidate, session=http_session, cookies=cookies) if candidate else None
+                    await batcher.flush()
                     if b64:
                         has_images = True
                         await resp.write(_sse_format(event="image", data={"base64": b64}))
                     else:
                         await resp.write(_sse_format(event="image", data={"base64": ""}))
-                else:
-                    if chunk:
-                        has_text = True
-                    await resp.write(_sse_format(event="text", data={"chunk": str(chunk)}))
-        try:
-            print(
-                f"[server] id={request_id} /stream resp has_text={has_text} has_images={has_images}"
-            )
-        except Exception:
-            pass
+                    continue
+                if chunk.startswith(_IMG_PENDING_PREFIX):
+                    # Tell the client an image is still rendering without
+                    # leaking the internal placeholder URL as text.
+                    await batcher.flush()
+                    await resp.write(_sse_format(event="image_pending", data={}))
+                    continue
+            if chunk:
+                has_text = True
+            await batcher.push(_sse_format_text(str(chunk)))
+        await batcher.flush()
+        logger.info(
+            "id=%s /stream resp has_text=%s has_images=%s", request_id, has_text, has_images
+        )
         await resp.write(_sse_format(event="done", data={}))
     except ConnectionResetError:
         return resp
@@ -317,8 +581,39 @@ async def stream(request: web.Request) -> web.StreamResponse:
     return resp
 
 
+async def _init_http_session(app: web.Application) -> None:
+    # One shared session for all image downloads: ephemeral per-request
+    # sessions defeat connection pooling and pay a TLS handshake per image.
+    # Cookies are passed per request so refreshes are picked up immediately.
+    # Image URLs cluster on a handful of Google hosts, so allow a deeper pool
+    # per host and keep connections warm well past a typical request burst.
+    app["http_session"] = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=200,
+            limit_per_host=32,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+        ),
+    )
+
+
+async def _close_http_session(app: web.Application) -> None:
+    await app["http_session"].close()
+
+
+async def _close_gemini_cache(app: web.Application) -> None:
+    instances = list(_GEMINI_CACHE.values())
+    _GEMINI_CACHE.clear()
+    for ai in instances:
+        await ai.aclose()
+
+
 def create_app() -> web.Application:
     app = web.Application()
+    app.on_startup.append(_init_http_session)
+    app.on_cleanup.append(_close_http_session)
+    app.on_cleanup.append(_close_gemini_cache)
     app.router.add_get("/health", health)
     app.router.add_post("/chat", chat)
     app.router.add_post("/stream", stream)
@@ -344,8 +639,8 @@ async def _serve(*, host: str, port: int) -> None:
     site = web.TCPSite(runner, host=host, port=port)
     await site.start()
 
-    print(f"[server] listening on http://{host}:{port}")
-    print("[server] endpoints: GET /health, POST /chat, POST /stream (SSE)")
+    logger.info("listening on http://%s:%s", host, port)
+    logger.info("endpoints: GET /health, POST /chat, POST /stream (SSE)")
 
     try:
         while True:
@@ -360,6 +655,18 @@ def main() -> None:
     p.add_argument("--port", type=int, default=8000)
     args = p.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="[server] %(message)s")
+
+    # uvloop's libuv-based loop cuts per-write overhead on streamed SSE;
+    # purely optional, the stdlib loop is used wherever it is missing.
+    if sys.platform == "linux":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            uvloop.install()
+
     asyncio.run(_serve(host=args.host, port=args.port))
 
 